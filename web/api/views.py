@@ -2068,8 +2068,8 @@ class SubdomainChangesViewSet(viewsets.ModelViewSet):
 			.filter(id__lte=scan_id)
 			.exclude(Q(scan_status=-1) | Q(scan_status=1))
 		)
-		if scan_history_query.count() > 1:
-			last_scan = scan_history_query.order_by('-start_scan_date')[1]
+		last_scan = scan_history_query.order_by('-start_scan_date')[1:2].first()
+		if last_scan:
 			scanned_host_q1 = (
 				Subdomain.objects
 				.filter(scan_history__id=scan_id)
@@ -2147,8 +2147,8 @@ class EndPointChangesViewSet(viewsets.ModelViewSet):
 			.filter(id__lte=scan_id)
 			.filter(scan_status=2)
 		)
-		if scan_history.count() > 1:
-			last_scan = scan_history.order_by('-start_scan_date')[1]
+		last_scan = scan_history.order_by('-start_scan_date')[1:2].first()
+		if last_scan:
 			scanned_host_q1 = (
 				EndPoint.objects
 				.filter(scan_history__id=scan_id)
@@ -9,7 +9,7 @@ from django.contrib.auth import update_session_auth_hash
 from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.contrib import messages
-from django.db.models import Count
+from django.db.models import Count, Q
 from django.db.models.functions import TruncDay
 from django.dispatch import receiver
 from django.shortcuts import redirect, render, get_object_or_404
@@ -44,19 +44,35 @@ def index(request, slug):
     scan_activities = ScanActivity.objects.filter(scan_of__in=scan_histories)
 
     domain_count = domains.count()
-    endpoint_count = endpoints.count()
     scan_count = scan_histories.count()
-    subdomain_count = subdomains.count()
     subdomain_with_ip_count = subdomains.filter(ip_addresses__isnull=False).count()
-    alive_count = subdomains.exclude(http_status__exact=0).count()
-    endpoint_alive_count = endpoints.filter(http_status__exact=200).count()
 
-    info_count = vulnerabilities.filter(severity=0).count()
-    low_count = vulnerabilities.filter(severity=1).count()
-    medium_count = vulnerabilities.filter(severity=2).count()
-    high_count = vulnerabilities.filter(severity=3).count()
-    critical_count = vulnerabilities.filter(severity=4).count()
-    unknown_count = vulnerabilities.filter(severity=-1).count()
+    # One conditional aggregate per table instead of one COUNT(*) per filter
+    subdomain_counts = subdomains.aggregate(
+        total=Count('id'),
+        alive=Count('id', filter=~Q(http_status__exact=0)))
+    subdomain_count = subdomain_counts['total']
+    alive_count = subdomain_counts['alive']
+
+    endpoint_counts = endpoints.aggregate(
+        total=Count('id'),
+        alive=Count('id', filter=Q(http_status__exact=200)))
+    endpoint_count = endpoint_counts['total']
+    endpoint_alive_count = endpoint_counts['alive']
+
+    vuln_counts = vulnerabilities.aggregate(
+        info=Count('id', filter=Q(severity=0)),
+        low=Count('id', filter=Q(severity=1)),
+        medium=Count('id', filter=Q(severity=2)),
+        high=Count('id', filter=Q(severity=3)),
+        critical=Count('id', filter=Q(severity=4)),
+        unknown=Count('id', filter=Q(severity=-1)))
+    info_count = vuln_counts['info']
+    low_count = vuln_counts['low']
+    medium_count = vuln_counts['medium']
+    high_count = vuln_counts['high']
+    critical_count = vuln_counts['critical']
+    unknown_count = vuln_counts['unknown']
 
     vulnerability_feed = vulnerabilities.order_by('-discovered_date')[:50]
     activity_feed = scan_activities.order_by('-time')[:50]
@@ -90,38 +106,18 @@ def index(request, slug):
     last_7_dates = [(timezone.now() - timedelta(days=i)).date()
                     for i in range(0, 7)]
 
-    targets_in_last_week = []
-    subdomains_in_last_week = []
-    vulns_in_last_week = []
-    scans_in_last_week = []
-    endpoints_in_last_week = []
-
-    for date in last_7_dates:
-        _target = count_targets_by_date.filter(date=date)
-        _subdomain = count_subdomains_by_date.filter(date=date)
-        _vuln = count_vulns_by_date.filter(date=date)
-        _scan = count_scans_by_date.filter(date=date)
-        _endpoint = count_endpoints_by_date.filter(date=date)
-        if _target:
-            targets_in_last_week.append(_target[0]['created_count'])
-        else:
-            targets_in_last_week.append(0)
-        if _subdomain:
-            subdomains_in_last_week.append(_subdomain[0]['count'])
-        else:
-            subdomains_in_last_week.append(0)
-        if _vuln:
-            vulns_in_last_week.append(_vuln[0]['count'])
-        else:
-            vulns_in_last_week.append(0)
-        if _scan:
-            scans_in_last_week.append(_scan[0]['count'])
-        else:
-            scans_in_last_week.append(0)
-        if _endpoint:
-            endpoints_in_last_week.append(_endpoint[0]['count'])
-        else:
-            endpoints_in_last_week.append(0)
+    # Evaluate each per-day query once, then look the days up in memory
+    targets_by_date = {row['date'].date(): row['created_count'] for row in count_targets_by_date}
+    subdomains_by_date = {row['date'].date(): row['count'] for row in count_subdomains_by_date}
+    vulns_by_date = {row['date'].date(): row['count'] for row in count_vulns_by_date}
+    scans_by_date = {row['date'].date(): row['count'] for row in count_scans_by_date}
+    endpoints_by_date = {row['date'].date(): row['count'] for row in count_endpoints_by_date}
+
+    targets_in_last_week = [targets_by_date.get(date, 0) for date in last_7_dates]
+    subdomains_in_last_week = [subdomains_by_date.get(date, 0) for date in last_7_dates]
+    vulns_in_last_week = [vulns_by_date.get(date, 0) for date in last_7_dates]
+    scans_in_last_week = [scans_by_date.get(date, 0) for date in last_7_dates]
+    endpoints_in_last_week = [endpoints_by_date.get(date, 0) for date in last_7_dates]
 
     targets_in_last_week.reverse()
     subdomains_in_last_week.reverse()
@@ -417,8 +413,9 @@ def onboarding(request):
     context['openai_key'] = OpenAiAPIKey.objects.first()
     context['netlas_key'] = NetlasAPIKey.objects.first()
     context['chaos_key'] = ChaosAPIKey.objects.first()
-    context['hackerone_key'] = HackerOneAPIKey.objects.first().key if HackerOneAPIKey.objects.first() else ''
-    context['hackerone_username'] = HackerOneAPIKey.objects.first().username if HackerOneAPIKey.objects.first() else ''
+    hackerone_api_key = HackerOneAPIKey.objects.first()
+    context['hackerone_key'] = hackerone_api_key.key if hackerone_api_key else ''
+    context['hackerone_username'] = hackerone_api_key.username if hackerone_api_key else ''
 
     context['user_preferences'], _ = UserPreferences.objects.get_or_create(
         user=request.user
@@ -18,6 +18,17 @@ cache = None
 if 'CELERY_BROKER' in os.environ:
 	cache = Redis.from_url(os.environ['CELERY_BROKER'])
 
+# create a rule for tasks that has to run parallel like dalfox
+# xss scan but not necessarily part of main task rather part like
+# dalfox scan being part of vulnerability task
+DEPENDENT_TASKS = {
+	'dalfox_xss_scan': 'vulnerability_scan',
+	'crlfuzz': 'vulnerability_scan',
+	'nuclei_scan': 'vulnerability_scan',
+	'nuclei_individual_severity_module': 'vulnerability_scan',
+	's3scanner': 'vulnerability_scan',
+}
+
 
 class ReconpointRequest(Request):
 	success_msg = ''
@@ -73,8 +84,8 @@ class ReconpointTask(Task):
 		self.yaml_configuration = ctx.get('yaml_configuration', {})
 		self.out_of_scope_subdomains = ctx.get('out_of_scope_subdomains', [])
 		self.history_file = f'{self.results_dir}/commands.txt'
-		self.scan = ScanHistory.objects.filter(pk=self.scan_id).first()
-		self.subscan = SubScan.objects.filter(pk=self.subscan_id).first()
+		self.scan = ScanHistory.objects.select_related('domain').filter(pk=self.scan_id).first()
+		self.subscan = SubScan.objects.select_related('subdomain').filter(pk=self.subscan_id).first()
 		self.engine = EngineType.objects.filter(pk=self.engine_id).first()
 		self.domain = self.scan.domain if self.scan else None
 		self.domain_id = self.domain.id if self.domain else None
@@ -94,23 +105,13 @@ class ReconpointTask(Task):
 
 		if RECONPOINT_RECORD_ENABLED:
 			if self.engine: # task not in engine.tasks, skip it.
-				# create a rule for tasks that has to run parallel like dalfox
-				# xss scan but not necessarily part of main task rather part like
-				# dalfox scan being part of vulnerability task
-				dependent_tasks = {
-					'dalfox_xss_scan': 'vulnerability_scan',
-					'crlfuzz': 'vulnerability_scan',
-					'nuclei_scan': 'vulnerability_scan',
-					'nuclei_individual_severity_module': 'vulnerability_scan',
-					's3scanner': 'vulnerability_scan',
-				}
-				if self.track and self.task_name not in self.engine.tasks and dependent_tasks.get(self.task_name) not in self.engine.tasks:
-					logger.debug(f'Task {self.name} is not part of engine "{self.engine.engine_name}" tasks. Skipping.')
+				if self.track and self.task_name not in self.engine.tasks and DEPENDENT_TASKS.get(self.task_name) not in self.engine.tasks:
+					logger.debug('Task %s is not part of engine "%s" tasks. Skipping.', self.name, self.engine.engine_name)
 					return
 
 			# Create ScanActivity for this task and send start scan notifs
 			if self.track:
-				logger.warning(f'Task {self.task_name} is RUNNING')
+				logger.warning('Task %s is RUNNING', self.task_name)
 				self.create_scan_activity()
 
 		if RECONPOINT_CACHE_ENABLED:
@@ -120,7 +121,7 @@ class ReconpointTask(Task):
 			if result and result != b'null':
 				self.status = SUCCESS_TASK
 				if RECONPOINT_RECORD_ENABLED and self.track:
-					logger.warning(f'Task {self.task_name} status is SUCCESS (CACHED)')
+					logger.warning('Task %s status is SUCCESS (CACHED)', self.task_name)
 					self.update_scan_activity()
 				return json.loads(result)
 
@@ -145,7 +146,8 @@ class ReconpointTask(Task):
 			if RECONPOINT_RAISE_ON_ERROR:
 				raise exc
 
-			logger.exception(exc)
+			# Reuse the formatted traceback instead of walking the frames again
+			logger.error(self.traceback)
 
 		finally:
 			self.write_results()
@@ -157,16 +159,18 @@ class ReconpointTask(Task):
 				self.update_scan_activity()
 
 		# Set task result in cache if task was successful
-		if RECONPOINT_CACHE_ENABLED and self.status == SUCCESS_TASK and result:
-			cache.set(record_key, json.dumps(result))
-			cache.expire(record_key, 600) # 10mn cache
+		if RECONPOINT_CACHE_ENABLED and self.status == SUCCESS_TASK and self.result:
+			try:
+				cache.set(record_key, json.dumps(self.result), ex=600) # 10mn cache
+			except (TypeError, ValueError):
+				logger.debug('Task %s result is not JSON serializable. Skipping cache.', self.task_name)
 
 		return self.result
 
 	def write_results(self):
 		if not self.result:
 			return False
-		is_json_results = isinstance(self.result, dict) or isinstance(self.result, list)
+		is_json_results = isinstance(self.result, (dict, list))
 		if not self.output_path:
 			return False
 		if not os.path.exists(self.output_path):
@@ -175,7 +179,7 @@ class ReconpointTask(Task):
 					json.dump(self.result, f, indent=4)
 				else:
 					f.write(self.result)
-			logger.warning(f'Wrote {self.task_name} results to {self.output_path}')
+			logger.warning('Wrote %s results to %s', self.task_name, self.output_path)
 
 	def create_scan_activity(self):
 		if not self.track:
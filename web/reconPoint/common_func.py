@@ -1,6 +1,8 @@
 import whatportis
 import socket
+import hashlib
 import json
+import logging
 import os
 import pickle
 import random
@@ -33,6 +35,7 @@ from reconPoint.utilities import is_valid_url
 
 logger = get_task_logger(__name__)
 DISCORD_WEBHOOKS_CACHE = redis.Redis.from_url(CELERY_BROKER_URL)
+DISCORD_WEBHOOKS_CACHE_TTL = 60 * 60 * 24 * 7 # 1 week
 
 #------------------#
 # EngineType utils #
@@ -120,22 +123,21 @@ def get_subdomains(write_filepath=None, exclude_subdomains=False, ctx={}):
 	exclude_subdomains = ctx.get('exclude_subdomains', False)
 	url_filter = ctx.get('url_filter', '')
 	domain = Domain.objects.filter(pk=domain_id).first()
-	scan = ScanHistory.objects.filter(pk=scan_id).first()
 
 	query = Subdomain.objects
 	if domain:
 		query = query.filter(target_domain=domain)
-	if scan:
-		query = query.filter(scan_history=scan)
+	if scan_id:
+		query = query.filter(scan_history_id=scan_id)
 	if subdomain_id:
 		query = query.filter(pk=subdomain_id)
 	elif domain and exclude_subdomains:
 		query = query.filter(name=domain.name)
 	subdomain_query = query.distinct('name').order_by('name')
 	subdomains = [
-		subdomain.name
-		for subdomain in subdomain_query.all()
-		if subdomain.name
+		name
+		for name in subdomain_query.values_list('name', flat=True)
+		if name
 	]
 	if not subdomains:
 		logger.error('No subdomains were found in query !')
@@ -165,9 +167,9 @@ def get_new_added_subdomain(scan_id, domain_id):
 		.filter(tasks__overlap=['subdomain_discovery'])
 		.filter(id__lte=scan_id)
 	)
-	if not scan.count() > 1:
+	last_scan = scan.order_by('-start_scan_date')[1:2].first()
+	if not last_scan:
 		return
-	last_scan = scan.order_by('-start_scan_date')[1]
 	scanned_host_q1 = (
 		Subdomain.objects
 		.filter(scan_history__id=scan_id)
@@ -202,9 +204,9 @@ def get_removed_subdomain(scan_id, domain_id):
 		.filter(tasks__overlap=['subdomain_discovery'])
 		.filter(id__lte=scan_id)
 	)
-	if not scan_history.count() > 1:
+	last_scan = scan_history.order_by('-start_scan_date')[1:2].first()
+	if not last_scan:
 		return
-	last_scan = scan_history.order_by('-start_scan_date')[1]
 	scanned_host_q1 = (
 		Subdomain.objects
 		.filter(scan_history__id=scan_id)
@@ -303,13 +305,12 @@ def get_http_urls(
 	subdomain_id = ctx.get('subdomain_id')
 	url_filter = ctx.get('url_filter', '')
 	domain = Domain.objects.filter(pk=domain_id).first()
-	scan = ScanHistory.objects.filter(pk=scan_id).first()
 
 	query = EndPoint.objects
 	if domain:
 		query = query.filter(target_domain=domain)
-	if scan:
-		query = query.filter(scan_history=scan)
+	if scan_id:
+		query = query.filter(scan_history_id=scan_id)
 	if subdomain_id:
 		query = query.filter(subdomain__id=subdomain_id)
 	elif exclude_subdomains and domain:
@@ -330,8 +331,13 @@ def get_http_urls(
 		else:
 			query = query.filter(http_url__contains=url)
 
-	# Select distinct endpoints and order
-	endpoints = query.distinct('http_url').order_by('http_url').all()
+	# Select distinct endpoints and order, loading only the fields used below
+	endpoints = (
+		query
+		.distinct('http_url')
+		.order_by('http_url')
+		.only('http_url', 'http_status')
+	)
 
 	# If is_alive is True, select only endpoints that are alive
 	if is_alive:
@@ -506,10 +512,8 @@ def get_random_proxy():
 	Returns:
 		str: Proxy name or '' if no proxy defined in db or use_proxy is False.
 	"""
-	if not Proxy.objects.all().exists():
-		return ''
 	proxy = Proxy.objects.first()
-	if not proxy.use_proxy:
+	if not proxy or not proxy.use_proxy:
 		return ''
 	proxy_name = random.choice(proxy.proxies.splitlines())
 	logger.warning('Using proxy: ' + proxy_name)
@@ -577,13 +581,18 @@ def get_cms_details(url):
 # NOTIFICATION UTILS #
 #--------------------#
 
-def send_telegram_message(message):
+NOTIFICATION_HTTP_TIMEOUT = 10 # seconds
+
+def send_telegram_message(message, notif=None):
 	"""Send Telegram message.
 
 	Args:
 		message (str): Message.
+		notif (scanEngine.models.Notification, optional): Notification
+			settings, fetched from DB if not passed.
 	"""
-	notif = Notification.objects.first()
+	if notif is None:
+		notif = Notification.objects.first()
 	do_send = (
 		notif and
 		notif.send_to_telegram and
@@ -594,18 +603,24 @@ def send_telegram_message(message):
 	telegram_bot_token = notif.telegram_bot_token
 	telegram_bot_chat_id = notif.telegram_bot_chat_id
 	send_url = f'https://api.telegram.org/bot{telegram_bot_token}/sendMessage?chat_id={telegram_bot_chat_id}&parse_mode=Markdown&text={message}'
-	requests.get(send_url)
+	try:
+		requests.get(send_url, timeout=NOTIFICATION_HTTP_TIMEOUT)
+	except requests.RequestException as e:
+		logger.error('Error while sending message to Telegram: %s', e)
 
 
-def send_slack_message(message):
+def send_slack_message(message, notif=None):
 	"""Send Slack message.
 
 	Args:
 		message (str): Message.
+		notif (scanEngine.models.Notification, optional): Notification
+			settings, fetched from DB if not passed.
 	"""
 	headers = {'content-type': 'application/json'}
 	message = {'text': message}
-	notif = Notification.objects.first()
+	if notif is None:
+		notif = Notification.objects.first()
 	do_send = (
 		notif and
 		notif.send_to_slack and
@@ -613,17 +628,23 @@ def send_slack_message(message):
 	if not do_send:
 		return
 	hook_url = notif.slack_hook_url
-	requests.post(url=hook_url, data=json.dumps(message), headers=headers)
+	try:
+		requests.post(url=hook_url, data=json.dumps(message), headers=headers, timeout=NOTIFICATION_HTTP_TIMEOUT)
+	except requests.RequestException as e:
+		logger.error('Error while sending message to Slack: %s', e)
 
-def send_lark_message(message):
+def send_lark_message(message, notif=None):
 	"""Send lark message.
 
 	Args:
 		message (str): Message.
+		notif (scanEngine.models.Notification, optional): Notification
+			settings, fetched from DB if not passed.
 	"""
 	headers = {'content-type': 'application/json'}
 	message = {"msg_type":"interactive","card":{"elements":[{"tag":"div","text":{"content":message,"tag":"lark_md"}}]}}
-	notif = Notification.objects.first()
+	if notif is None:
+		notif = Notification.objects.first()
 	do_send = (
 		notif and
 		notif.send_to_lark and
@@ -631,7 +652,10 @@ def send_lark_message(message):
 	if not do_send:
 		return
 	hook_url = notif.lark_hook_url
-	requests.post(url=hook_url, data=json.dumps(message), headers=headers)
+	try:
+		requests.post(url=hook_url, data=json.dumps(message), headers=headers, timeout=NOTIFICATION_HTTP_TIMEOUT)
+	except requests.RequestException as e:
+		logger.error('Error while sending message to Lark: %s', e)
 
 def send_discord_message(
 		message,
@@ -640,7 +664,8 @@ def send_discord_message(
 		url=None,
 		files=None,
 		fields={},
-		fields_append=[]):
+		fields_append=[],
+		notif=None):
 	"""Send Discord message.
 
 	If title and fields are specified, ignore the 'message' and create a Discord
@@ -656,10 +681,13 @@ def send_discord_message(
 		fields (dict, optional): Discord embed fields.
 		fields_append (list, optional): Discord embed field names to update
 			instead of overwrite.
+		notif (scanEngine.models.Notification, optional): Notification
+			settings, fetched from DB if not passed.
 	"""
 
 	# Check if do send
-	notif = Notification.objects.first()
+	if notif is None:
+		notif = Notification.objects.first()
 	if not (notif and notif.send_to_discord and notif.discord_hook_url):
 		return False
 
@@ -682,6 +710,7 @@ def send_discord_message(
 		webhook = DiscordWebhook(
 			url=notif.discord_hook_url,
 			rate_limit_retry=False,
+			timeout=NOTIFICATION_HTTP_TIMEOUT,
 			content=message)
 
 	# Get existing embed if found in cache
@@ -701,7 +730,8 @@ def send_discord_message(
 		embed.set_description(message)
 		embed.set_timestamp()
 		existing_fields_dict = {field['name']: field['value'] for field in embed.fields}
-		logger.debug(''.join([f'\n\t{k}: {v}' for k, v in fields.items()]))
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug(''.join([f'\n\t{k}: {v}' for k, v in fields.items()]))
 		for name, value in fields.items():
 			if not value: # cannot send empty field values to Discord [error 400]
 				continue
@@ -732,8 +762,8 @@ def send_discord_message(
 		webhook.add_embed(embed)
 
 		# Add webhook and embed objects to cache, so we can pick them up later
-		DISCORD_WEBHOOKS_CACHE.set(title + '_webhook', pickle.dumps(webhook))
-		DISCORD_WEBHOOKS_CACHE.set(title + '_embed', pickle.dumps(embed))
+		DISCORD_WEBHOOKS_CACHE.set(title + '_webhook', pickle.dumps(webhook), ex=DISCORD_WEBHOOKS_CACHE_TTL)
+		DISCORD_WEBHOOKS_CACHE.set(title + '_embed', pickle.dumps(embed), ex=DISCORD_WEBHOOKS_CACHE_TTL)
 
 	# Add files to webhook
 	if files:
@@ -743,12 +773,17 @@ def send_discord_message(
 			webhook.add_file(content, name)
 
 	# Edit webhook if it already existed, otherwise send new webhook
-	if cached_response:
-		response = webhook.edit(cached_response)
-	else:
-		response = webhook.execute()
+	try:
+		if cached_response:
+			response = webhook.edit(cached_response)
+		else:
+			response = webhook.execute()
+	except requests.RequestException as e:
+		logger.error('Error while sending webhook data to Discord: %s', e)
+		return
+	if not cached_response:
 		if use_discord_embed and response.status_code == 200:
-			DISCORD_WEBHOOKS_CACHE.set(title, pickle.dumps(response))
+			DISCORD_WEBHOOKS_CACHE.set(title, pickle.dumps(response), ex=DISCORD_WEBHOOKS_CACHE_TTL)
 
 	# Get status code
 	if response.status_code == 429:
@@ -763,7 +798,8 @@ def send_discord_message(
 				url,
 				files,
 				fields,
-				fields_append)
+				fields_append,
+				notif)
 	elif response.status_code != 200:
 		logger.error(
 			f'Error while sending webhook data to Discord.'
@@ -860,9 +896,19 @@ def get_task_header_message(name, scan_history_id, subscan_id):
 
 
 def get_task_cache_key(func_name, *args, **kwargs):
-	args_str = '_'.join([str(arg) for arg in args])
-	kwargs_str = '_'.join([f'{k}={v}' for k, v in kwargs.items() if k not in RECONPOINT_TASK_IGNORE_CACHE_KWARGS])
-	return f'{func_name}__{args_str}__{kwargs_str}'
+	# Task args can hold long host / URL lists, keep the Redis key fixed-size.
+	# Feed each part to the hasher directly instead of joining them first.
+	args_hash = hashlib.blake2b(digest_size=16)
+	for arg in args:
+		args_hash.update(str(arg).encode())
+		args_hash.update(b'\x00')
+	args_hash.update(b'\x01')
+	for k, v in kwargs.items():
+		if k in RECONPOINT_TASK_IGNORE_CACHE_KWARGS:
+			continue
+		args_hash.update(f'{k}={v}'.encode())
+		args_hash.update(b'\x00')
+	return f'{func_name}__{args_hash.hexdigest()}'
 
 
 def get_output_file_name(scan_history_id, subscan_id, filename):
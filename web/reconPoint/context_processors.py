@@ -4,11 +4,10 @@ from django.conf import settings
 
 def projects(request):
     projects = Project.objects.all()
-    try:
-        slug = request.resolver_match.kwargs.get('slug')
-        project = Project.objects.get(slug=slug)
-    except Exception:
-        project = None
+    project = None
+    slug = request.resolver_match.kwargs.get('slug') if request.resolver_match else None
+    if slug:
+        project = Project.objects.filter(slug=slug).first()
     return {
         'projects': projects,
         'current_project': project
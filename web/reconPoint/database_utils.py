@@ -44,14 +44,14 @@ def bulk_import_targets(
 		description = target.get('description', '')
 		
 		if not name:
-			logger.warning(f"Skipping target with empty name")
+			logger.warning('Skipping target with empty name')
 			continue
 		
 		is_domain = validators.domain(name)
 		is_ip = validators.ipv4(name) or validators.ipv6(name)
 		is_url = validators.url(name)
 
-		logger.info(f'{name} | Domain? {is_domain} | IP? {is_ip} | URL? {is_url}')
+		logger.info('%s | Domain? %s | IP? %s | URL? %s', name, is_domain, is_ip, is_url)
 
 		if is_domain:
 			target_obj = store_domain(name, project, description, h1_team_handle)
@@ -60,7 +60,7 @@ def bulk_import_targets(
 		elif is_ip:
 			target_obj = store_ip(name, project, description, h1_team_handle)
 		else:
-			logger.warning(f'{name} is not supported by reconPoint')
+			logger.warning('%s is not supported by reconPoint', name)
 			continue
 
 		if target_obj:
@@ -90,7 +90,7 @@ def bulk_import_targets(
 			for target in all_targets:
 				org.domains.add(target)
 
-			logger.info(f"{'Created' if created else 'Updated'} organization {org_name} with {len(all_targets)} targets")
+			logger.info('%s organization %s with %d targets', 'Created' if created else 'Updated', org_name, len(all_targets))
 
 	return new_targets_imported
 
@@ -110,7 +110,7 @@ def store_domain(domain_name, project, description, h1_team_handle):
 	existing_domain = Domain.objects.filter(name=domain_name).first()
 
 	if existing_domain:
-		logger.info(f'Domain {domain_name} already exists. skipping.')
+		logger.info('Domain %s already exists. skipping.', domain_name)
 		return
 	
 	current_time = timezone.now()
@@ -123,7 +123,7 @@ def store_domain(domain_name, project, description, h1_team_handle):
 		insert_date=current_time
 	)
 
-	logger.info(f'Added new domain {new_domain.name}')
+	logger.info('Added new domain %s', new_domain.name)
 
 	return new_domain
 
@@ -135,7 +135,7 @@ def store_url(url, project, description, h1_team_handle):
 	domain = Domain.objects.filter(name=domain_name).first()
 
 	if domain:
-		logger.info(f'Domain {domain_name} already exists. skipping...')
+		logger.info('Domain %s already exists. skipping...', domain_name)
 
 	else:
 		domain = Domain.objects.create(
@@ -145,7 +145,7 @@ def store_url(url, project, description, h1_team_handle):
 			project=project,
 			insert_date=timezone.now()
 		)
-		logger.info(f'Added new domain {domain.name}')
+		logger.info('Added new domain %s', domain.name)
 
 	EndPoint.objects.get_or_create(
 		target_domain=domain,
@@ -159,7 +159,7 @@ def store_ip(ip_address, project, description, h1_team_handle):
 	domain = Domain.objects.filter(name=ip_address).first()
 	
 	if domain:
-		logger.info(f'Domain {ip_address} already exists. skipping...')
+		logger.info('Domain %s already exists. skipping...', ip_address)
 	else:
 		domain = Domain.objects.create(
 			name=ip_address,
@@ -169,7 +169,7 @@ def store_ip(ip_address, project, description, h1_team_handle):
 			insert_date=timezone.now(),
 			ip_address_cidr=ip_address
 		)
-		logger.info(f'Added new domain {domain.name}')
+		logger.info('Added new domain %s', domain.name)
 	
 	ip_data = get_ip_info(ip_address)
 	ip_data = get_ip_info(ip_address)
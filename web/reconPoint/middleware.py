@@ -1,3 +1,5 @@
+from django.utils.functional import SimpleLazyObject
+
 from dashboard.models import UserPreferences
 
 class UserPreferencesMiddleware:
@@ -6,5 +8,8 @@ class UserPreferencesMiddleware:
 
 	def __call__(self, request):
 		if request.user.is_authenticated:
-			request.user_preferences, created = UserPreferences.objects.get_or_create(user=request.user)
+			# only hit the database when a template or view actually reads it
+			request.user_preferences = SimpleLazyObject(
+				lambda: UserPreferences.objects.get_or_create(user=request.user)[0]
+			)
 		return self.get_response(request)
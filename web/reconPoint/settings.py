@@ -231,6 +231,7 @@ LOGGING = {
             'level': 'ERROR',
             'class': 'logging.FileHandler',
             'filename': 'errors.log',
+            'delay': True,
         },
         'null': {
             'class': 'logging.NullHandler'
@@ -256,13 +257,15 @@ LOGGING = {
             'formatter': 'brief',
             'filename': 'db.log',
             'maxBytes': 1024,
-            'backupCount': 3
+            'backupCount': 3,
+            'delay': True,
         },
         'celery': {
             'class': 'logging.handlers.RotatingFileHandler',
             'formatter': 'simple',
             'filename': 'celery.log',
             'maxBytes': 1024 * 1024 * 100,  # 100 mb
+            'delay': True,
         },
     },
     'formatters': {
@@ -3062,18 +3062,49 @@ def http_crawl(
 # Notifications tasks #
 #---------------------#
 
+def _run_notif_sender(name, func, message, **kwargs):
+	"""Run a notification sender, logging its errors so that one failing
+	channel does not prevent the others from sending."""
+	try:
+		func(message, **kwargs)
+	except Exception as e:
+		logger.error('Failed to send %s notification: %s', name, e)
+
+
 @app.task(name='send_notif', bind=False, queue='send_notif_queue')
 def send_notif(
 		message,
 		scan_history_id=None,
 		subscan_id=None,
 		**options):
+	notif = Notification.objects.first()
+	if not notif:
+		return
 	if not 'title' in options:
 		message = enrich_notification(message, scan_history_id, subscan_id)
-	send_discord_message(message, **options)
-	send_slack_message(message)
-	send_lark_message(message)
-	send_telegram_message(message)
+
+	# senders get the loaded settings, so they do no ORM work of their own
+	senders = []
+	if notif.send_to_discord:
+		senders.append(('discord', send_discord_message, options))
+	if notif.send_to_slack:
+		senders.append(('slack', send_slack_message, {}))
+	if notif.send_to_lark:
+		senders.append(('lark', send_lark_message, {}))
+	if notif.send_to_telegram:
+		senders.append(('telegram', send_telegram_message, {}))
+	if not senders:
+		return
+
+	if len(senders) == 1:
+		name, func, kwargs = senders[0]
+		_run_notif_sender(name, func, message, notif=notif, **kwargs)
+		return
+
+	# each sender blocks on its own HTTP call, so run them side by side
+	with concurrent.futures.ThreadPoolExecutor(max_workers=len(senders)) as executor:
+		for name, func, kwargs in senders:
+			executor.submit(_run_notif_sender, name, func, message, notif=notif, **kwargs)
 
 
 @app.task(name='send_scan_notif', bind=False, queue='send_scan_notif_queue')
@@ -4460,15 +4491,14 @@ def save_endpoint(
 		http_url = sanitize_url(http_url)
 
 		# Try to get the first matching record (prevent duplicate error)
-		endpoints = EndPoint.objects.filter(
+		endpoint = EndPoint.objects.filter(
 			scan_history=scan,
 			target_domain=domain,
 			http_url=http_url,
 			**endpoint_data
-		)
+		).first()
 
-		if endpoints.exists():
-			endpoint = endpoints.first()
+		if endpoint:
 			created = False
 		else:
 			# No existing record, create a new one
@@ -4506,7 +4536,7 @@ def save_subdomain(subdomain_name, ctx={}):
 	scan_id = ctx.get('scan_history_id')
 	subscan_id = ctx.get('subscan_id')
 	out_of_scope_subdomains = ctx.get('out_of_scope_subdomains', [])
-	subdomain_checker = SubdomainScopeChecker(out_of_scope_subdomains)
+	subdomain_checker = get_subdomain_scope_checker(tuple(out_of_scope_subdomains))
 	valid_domain = (
 		validators.domain(subdomain_name) or
 		validators.ipv4(subdomain_name) or
@@ -4526,7 +4556,7 @@ def save_subdomain(subdomain_name, ctx={}):
 			logger.error(f"{subdomain_name} is not a subdomain of domain {domain.name}. Skipping.")
 			return None, False
 
-	scan = ScanHistory.objects.filter(pk=scan_id).first()
+	scan = ScanHistory.objects.select_related('domain').filter(pk=scan_id).first()
 	domain = scan.domain if scan else None
 	subdomain, created = Subdomain.objects.get_or_create(
 		scan_history=scan,
@@ -4623,14 +4653,19 @@ def save_imported_subdomains(subdomains, ctx={}):
 		return
 
 	logger.warning(f'Found {len(subdomains)} imported subdomains.')
+	imported_ids = []
 	with open(f'{results_dir}/from_imported.txt', 'w+') as output_file:
 		for name in subdomains:
 			subdomain_name = name.strip()
 			subdomain, _ = save_subdomain(subdomain_name, ctx=ctx)
-			subdomain.is_imported_subdomain = True
-			subdomain.save()
+			if not subdomain:
+				continue
+			imported_ids.append(subdomain.id)
 			output_file.write(f'{subdomain}\n')
 
+	# Flag all imported subdomains in a single UPDATE
+	Subdomain.objects.filter(id__in=imported_ids).update(is_imported_subdomain=True)
+
 
 @app.task(name='query_reverse_whois', bind=False, queue='query_reverse_whois_queue')
 def query_reverse_whois(lookup_keyword):
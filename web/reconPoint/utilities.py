@@ -2,6 +2,8 @@ import re
 import os
 import validators
 
+from functools import lru_cache
+
 from celery._state import get_current_task
 from celery.utils.log import ColorFormatter
 
@@ -126,6 +128,7 @@ class SubdomainScopeChecker:
 	def __init__(self, patterns):
 		self.regex_patterns = set()
 		self.plain_patterns = set()
+		self.regex_matchers = []
 		self.load_patterns(patterns)
 
 	def load_patterns(self, patterns):
@@ -145,6 +148,33 @@ class SubdomainScopeChecker:
 				self.regex_patterns.add(re.compile(pattern, re.IGNORECASE))
 			except re.error:
 				self.plain_patterns.add(pattern.lower())
+		self.regex_matchers = self.merge_patterns(self.regex_patterns)
+
+	@staticmethod
+	def merge_patterns(regex_patterns):
+		"""
+			Merge compiled patterns into a single alternation so a subdomain
+			is scanned once instead of once per pattern.
+
+			Args:
+				regex_patterns (set): Set of compiled patterns.
+			Returns:
+				list: A single merged pattern, or the original patterns if
+				they cannot be merged safely.
+		"""
+		if len(regex_patterns) < 2:
+			return list(regex_patterns)
+		# capturing groups would renumber backreferences once merged, and
+		# inline global flags like (?x) would apply to every merged pattern
+		# (python < 3.11 only warns about them mid-pattern)
+		default_flags = re.compile('', re.IGNORECASE).flags
+		if any(p.groups or p.flags != default_flags for p in regex_patterns):
+			return list(regex_patterns)
+		try:
+			merged = '|'.join(f'(?:{p.pattern})' for p in regex_patterns)
+			return [re.compile(merged, re.IGNORECASE)]
+		except re.error:
+			return list(regex_patterns)
 
 	def is_out_of_scope(self, subdomain):
 		"""
@@ -158,8 +188,21 @@ class SubdomainScopeChecker:
 		subdomain = subdomain.lower() # though we wont encounter this, but just in case
 		if subdomain in self.plain_patterns:
 			return True
-		return any(pattern.search(subdomain) for pattern in self.regex_patterns)
+		return any(pattern.search(subdomain) for pattern in self.regex_matchers)
+
+
+@lru_cache(maxsize=32)
+def get_subdomain_scope_checker(patterns):
+	"""
+		Return a SubdomainScopeChecker for the given patterns, reusing an
+		already built one when the same patterns are seen again.
 
+		Args:
+			patterns (tuple): Tuple of out-of-scope patterns.
+		Returns:
+			SubdomainScopeChecker: checker for these patterns.
+	"""
+	return SubdomainScopeChecker(patterns)
 
 
 def sorting_key(subdomain):
@@ -4,22 +4,24 @@ import validators
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+SHORT_NAME_INVALID_CHARS = re.compile(r'[@!#$%^&*()<>?/\|}{~:]')
+
+ERR_INVALID_DOMAIN = _('%(value)s is not a valid domain Name')
+ERR_INVALID_URL = _('%(value)s is not a valid URL Name')
+ERR_INVALID_SHORT_NAME = _('%(value)s is not a valid short name,'
+                           + ' can only contain - and _')
+
 
 def validate_domain(value):
     if not validators.domain(value):
-        raise ValidationError(_('%(value)s is not a valid domain Name'
-                                ), params={'value': value})
+        raise ValidationError(ERR_INVALID_DOMAIN, params={'value': value})
 
 
 def validate_url(value):
     if not validators.url(value):
-        raise ValidationError(_('%(value)s is not a valid URL Name'),
-                              params={'value': value})
+        raise ValidationError(ERR_INVALID_URL, params={'value': value})
 
 
 def validate_short_name(value):
-    regex = re.compile(r'[@!#$%^&*()<>?/\|}{~:]')
-    if regex.search(value):
-        raise ValidationError(_('%(value)s is not a valid short name,'
-                                + ' can only contain - and _'),
-                              params={'value': value})
+    if SHORT_NAME_INVALID_CHARS.search(value):
+        raise ValidationError(ERR_INVALID_SHORT_NAME, params={'value': value})
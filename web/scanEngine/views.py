@@ -159,15 +159,13 @@ def delete_wordlist(request, slug, id):
 
 @has_permission_decorator(PERM_MODIFY_INTERESTING_LOOKUP, redirect_url=FOUR_OH_FOUR_URL)
 def interesting_lookup(request, slug):
-    lookup_keywords = None
     context = {}
     context['scan_engine_nav_active'] = 'active'
     context['interesting_lookup_li'] = 'active'
     context['engine_ul_show'] = 'show'
     form = InterestingLookupForm()
-    if InterestingLookupModel.objects.filter(custom_type=True).exists():
-        lookup_keywords = InterestingLookupModel.objects.filter(custom_type=True).order_by('-id')[0]
-    else:
+    lookup_keywords = InterestingLookupModel.objects.filter(custom_type=True).order_by('-id').first()
+    if not lookup_keywords:
         form.initial_checkbox()
     if request.method == "POST":
         if lookup_keywords:
@@ -296,9 +294,8 @@ def reconpoint_settings(request, slug):
 def notification_settings(request, slug):
     context = {}
     form = NotificationForm()
-    notification = None
-    if Notification.objects.all().exists():
-        notification = Notification.objects.all()[0]
+    notification = Notification.objects.first()
+    if notification:
         form.set_value(notification)
     else:
         form.set_initial()
@@ -335,9 +332,8 @@ def proxy_settings(request, slug):
     form = ProxyForm()
     context['form'] = form
 
-    proxy = None
-    if Proxy.objects.all().exists():
-        proxy = Proxy.objects.all()[0]
+    proxy = Proxy.objects.first()
+    if proxy:
         form.set_value(proxy)
     else:
         form.set_initial()
@@ -386,9 +382,8 @@ def hackerone_settings(request, slug):
     form = HackeroneForm()
     context['form'] = form
 
-    hackerone = None
-    if Hackerone.objects.all().exists():
-        hackerone = Hackerone.objects.all()[0]
+    hackerone = Hackerone.objects.first()
+    if hackerone:
         form.set_value(hackerone)
     else:
         form.set_initial()
@@ -422,9 +417,8 @@ def report_settings(request, slug):
     primary_color = '#FFB74D'
     secondary_color = '#212121'
 
-    report = None
-    if VulnerabilityReportSetting.objects.all().exists():
-        report = VulnerabilityReportSetting.objects.all()[0]
+    report = VulnerabilityReportSetting.objects.first()
+    if report:
         primary_color = report.primary_color
         secondary_color = report.secondary_color
         form.set_value(report)
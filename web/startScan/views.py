@@ -5,7 +5,7 @@ from weasyprint import HTML, CSS
 from datetime import datetime
 from django.contrib import messages
 from django.db.models import Count, Case, When, IntegerField
-from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
+from django.http import HttpResponse, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.template.loader import get_template
 from django.urls import reverse
@@ -23,6 +23,9 @@ from scanEngine.models import EngineType
 from startScan.models import *
 from targetApp.models import *
 
+# Rows fetched per round trip when streaming scan results into an export
+EXPORT_CHUNK_SIZE = 2000
+
 
 def scan_history(request, slug):
     host = ScanHistory.objects.filter(domain__project__slug=slug).order_by('-start_scan_date')
@@ -208,8 +211,8 @@ def detail_scan(request, id, slug):
             ctx['matched_gf_count'] = count_gf
 
     # Find last scan for this domain
-    if last_scans.count() > 1:
-        last_scan = last_scans.order_by('-start_scan_date')[1]
+    last_scan = last_scans.order_by('-start_scan_date')[1:2].first()
+    if last_scan:
         ctx['last_scan'] = last_scan
 
     return render(request, 'startScan/detail_scan.html', ctx)
@@ -430,14 +433,17 @@ def start_multiple_scan(request, slug):
     return render(request, 'startScan/start_multiple_scan_ui.html', context)
 
 def export_subdomains(request, scan_id):
-    subdomain_list = Subdomain.objects.filter(scan_history__id=scan_id)
+    subdomain_names = (
+        Subdomain.objects
+        .filter(scan_history__id=scan_id)
+        .values_list('name', flat=True)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
     scan = ScanHistory.objects.get(id=scan_id)
-    response_body = ""
-    for domain in subdomain_list:
-        response_body += response_body + domain.name + "\n"
+    response_body = (f'{name}\n' for name in subdomain_names)
     scan_start_date_str = str(scan.start_scan_date.date())
     domain_name = scan.domain.name
-    response = HttpResponse(response_body, content_type='text/plain')
+    response = StreamingHttpResponse(response_body, content_type='text/plain')
     response['Content-Disposition'] = (
         f'attachment; filename="subdomains_{domain_name}_{scan_start_date_str}.txt"'
     )
@@ -445,14 +451,17 @@ def export_subdomains(request, scan_id):
 
 
 def export_endpoints(request, scan_id):
-    endpoint_list = EndPoint.objects.filter(scan_history__id=scan_id)
+    endpoint_urls = (
+        EndPoint.objects
+        .filter(scan_history__id=scan_id)
+        .values_list('http_url', flat=True)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
     scan = ScanHistory.objects.get(id=scan_id)
-    response_body = ""
-    for endpoint in endpoint_list:
-        response_body += endpoint.http_url + "\n"
+    response_body = (f'{http_url}\n' for http_url in endpoint_urls)
     scan_start_date_str = str(scan.start_scan_date.date())
     domain_name = scan.domain.name
-    response = HttpResponse(response_body, content_type='text/plain')
+    response = StreamingHttpResponse(response_body, content_type='text/plain')
     response['Content-Disposition'] = (
         f'attachment; filename="endpoints_{domain_name}_{scan_start_date_str}.txt"'
     )
@@ -460,15 +469,17 @@ def export_endpoints(request, scan_id):
 
 
 def export_urls(request, scan_id):
-    urls_list = Subdomain.objects.filter(scan_history__id=scan_id)
+    urls = (
+        Subdomain.objects
+        .filter(scan_history__id=scan_id)
+        .values_list('http_url', flat=True)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
     scan = ScanHistory.objects.get(id=scan_id)
-    response_body = ""
-    for url in urls_list:
-        if url.http_url:
-            response_body += response_body + url.http_url + "\n"
+    response_body = (f'{http_url}\n' for http_url in urls if http_url)
     scan_start_date_str = str(scan.start_scan_date.date())
     domain_name = scan.domain.name
-    response = HttpResponse(response_body, content_type='text/plain')
+    response = StreamingHttpResponse(response_body, content_type='text/plain')
     response['Content-Disposition'] = (
         f'attachment; filename="urls_{domain_name}_{scan_start_date_str}.txt"'
     )
@@ -85,7 +85,7 @@ class AddOrganizationForm(forms.Form):
 
     def clean_name(self):
         data = self.cleaned_data['name']
-        if Organization.objects.filter(name=data).count() > 0:
+        if Organization.objects.filter(name=data).exists():
             raise forms.ValidationError(f"{data} Organization already exists")
         return data
 
@@ -1,13 +1,14 @@
+import copy
 import json
 import logging
 import os
-import unittest
 
 os.environ['RECONPOINT_SECRET_KEY'] = 'secret'
 os.environ['CELERY_ALWAYS_EAGER'] = 'True'
 
 import yaml
 from celery.utils.log import get_task_logger
+from django.test import TestCase
 from reconPoint.settings import DEBUG
 from reconPoint.tasks import (dir_file_fuzz, fetch_url, http_crawl, initiate_scan,
                            osint, port_scan, subdomain_discovery,
@@ -16,57 +17,53 @@ from startScan.models import *
 
 logger = get_task_logger(__name__)
 DOMAIN_NAME = os.environ['DOMAIN_NAME']
+TEST_YAML_CONFIGURATION = {
+    'subdomain_discovery': {},
+    'port_scan': {},
+    'vulnerability_scan': {},
+    'osint': {},
+    'fetch_url': {},
+    'dir_file_fuzz': {},
+    'screenshot': {}
+}
+TEST_YAML_CONFIGURATION_DUMP = yaml.dump(TEST_YAML_CONFIGURATION)
 # if not DEBUG:
 #     logging.disable(logging.CRITICAL)
 
 
-class TestOnlineScan(unittest.TestCase):
-    def setUp(self):
-        self.url = f'https://{DOMAIN_NAME}'
-        self.yaml_configuration = {
-            'subdomain_discovery': {},
-            'port_scan': {},
-            'vulnerability_scan': {},
-            'osint': {},
-            'fetch_url': {},
-            'dir_file_fuzz': {},
-            'screenshot': {}
-        }
-        self.domain, _ = Domain.objects.get_or_create(name=DOMAIN_NAME)
-        self.engine = EngineType(
+class TestOnlineScan(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = f'https://{DOMAIN_NAME}'
+        cls.yaml_configuration = copy.deepcopy(TEST_YAML_CONFIGURATION)
+        cls.domain, _ = Domain.objects.get_or_create(name=DOMAIN_NAME)
+        cls.engine = EngineType(
             engine_name='test_engine',
-            yaml_configuration=yaml.dump(self.yaml_configuration))
-        self.engine.save()
-        self.scan = ScanHistory(
-            domain=self.domain,
-            scan_type=self.engine,
+            yaml_configuration=TEST_YAML_CONFIGURATION_DUMP)
+        cls.engine.save()
+        cls.scan = ScanHistory(
+            domain=cls.domain,
+            scan_type=cls.engine,
             start_scan_date=timezone.now())
-        self.scan.save()
-        self.endpoint, _ = EndPoint.objects.get_or_create(
-            scan_history=self.scan,
-            target_domain=self.domain,
-            http_url=self.url)
-        self.subdomain, _ = Subdomain.objects.get_or_create(
+        cls.scan.save()
+        cls.endpoint, _ = EndPoint.objects.get_or_create(
+            scan_history=cls.scan,
+            target_domain=cls.domain,
+            http_url=cls.url)
+        cls.subdomain, _ = Subdomain.objects.get_or_create(
             name=DOMAIN_NAME,
-            target_domain=self.domain,
-            scan_history=self.scan,
-            http_url=self.url)
+            target_domain=cls.domain,
+            scan_history=cls.scan,
+            http_url=cls.url)
 
-        self.ctx = {
+        cls.ctx = {
             'track': False,
-            'yaml_configuration': self.yaml_configuration,
+            'yaml_configuration': cls.yaml_configuration,
             'results_dir': '/tmp',
-            'scan_history_id': self.scan.id,
-            'engine_id': self.engine.id
+            'scan_history_id': cls.scan.id,
+            'engine_id': cls.engine.id
         }
 
-    def tearDown(self):
-        self.domain.delete()
-        self.subdomain.delete()
-        self.endpoint.delete()
-        self.scan.delete()
-        self.engine.delete()
-
     def test_http_crawl(self):
         results = http_crawl([DOMAIN_NAME], ctx=self.ctx)
         self.assertGreater(len(results), 0)
@@ -0,0 +1,57 @@
+import re
+import unittest
+
+from reconPoint.utilities import SubdomainScopeChecker
+
+
+SUBDOMAINS = [
+    'dev.example.com',
+    'DEV.example.com',
+    'staging.example.com',
+    'test.example.com',
+    'aa.example.com',
+    'admin.example.com',
+    'exact.example.com',
+    '[bad',
+    'prod.example.com',
+]
+
+
+class TestSubdomainScopeChecker(unittest.TestCase):
+    def assertMatchesPerPattern(self, patterns):
+        """Check is_out_of_scope() against each pattern applied on its own."""
+        checker = SubdomainScopeChecker(patterns)
+        for subdomain in SUBDOMAINS:
+            expected = False
+            for pattern in patterns:
+                try:
+                    expected |= bool(re.search(pattern, subdomain.lower(), re.IGNORECASE))
+                except re.error:
+                    expected |= subdomain.lower() == pattern.lower()
+            self.assertEqual(checker.is_out_of_scope(subdomain), expected, subdomain)
+        return checker
+
+    def test_plain_regexes_are_merged(self):
+        checker = self.assertMatchesPerPattern(['^dev\\.', 'test', 'staging\\.example\\.com'])
+        self.assertEqual(len(checker.regex_matchers), 1)
+
+    def test_capturing_groups_are_not_merged(self):
+        checker = self.assertMatchesPerPattern(['^(a)\\1\\.', 'test'])
+        self.assertEqual(len(checker.regex_matchers), 2)
+
+    def test_inline_global_flag_is_not_merged(self):
+        checker = self.assertMatchesPerPattern(['^dev\\.', '(?x) admin'])
+        self.assertEqual(len(checker.regex_matchers), 2)
+
+    def test_inline_ignorecase_flag(self):
+        # (?i) matches the flag the checker already compiles with
+        self.assertMatchesPerPattern(['^dev\\.', '(?i)ADMIN'])
+
+    def test_uncompilable_pattern_is_plain(self):
+        checker = self.assertMatchesPerPattern(['[bad', '^dev\\.', 'exact.example.com'])
+        self.assertEqual(checker.plain_patterns, {'[bad'})
+        self.assertEqual(len(checker.regex_matchers), 1)
+
+    def test_no_patterns(self):
+        checker = self.assertMatchesPerPattern([])
+        self.assertEqual(checker.regex_matchers, [])